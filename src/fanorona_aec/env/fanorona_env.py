@@ -34,7 +34,10 @@ def env(render_mode: RenderMode | None = None) -> AECEnv:
     if render_mode == "ansi":
         env = wrappers.CaptureStdoutWrapper(env)
     env = wrappers.TerminateIllegalWrapper(env, illegal_reward=-1)
-    env = wrappers.AssertOutOfBoundsWrapper(env)
+    # the wrapper only performs an assert on every step, so leave it out when assertions are
+    # disabled (python -O) instead of paying for the extra wrapper layer
+    if __debug__:
+        env = wrappers.AssertOutOfBoundsWrapper(env)
     env = wrappers.OrderEnforcingWrapper(env)
     return env
 
@@ -208,14 +211,15 @@ class raw_env(AECEnv):  # type: ignore
 
         self._state[self.agent_selection] = action
 
+        board_state = self.board_state
         chosen_move = FanoronaMove.from_action(action)
-        legal_moves = list(self.board_state.legal_moves)
+        legal_moves = board_state.legal_moves
         # assert chosen_move in legal_moves
-        self.board_state.push(chosen_move)
-        game_over = self.board_state.done
+        board_state.push(chosen_move)
+        game_over = board_state.done
 
         if game_over:
-            result = 1 if self.board_state.winner == Piece.WHITE else -1
+            result = 1 if board_state.winner == Piece.WHITE else -1
             (
                 self.rewards[self.agents[0]],
                 self.rewards[self.agents[1]],
@@ -231,7 +235,7 @@ class raw_env(AECEnv):  # type: ignore
         self.truncations = {agent: False for agent in self.agents}
 
         # observe the current state
-        self.observations[current_agent] = self.board_state
+        self.observations[current_agent] = board_state
         self.infos[current_agent] = {"legal_moves": legal_moves}
 
         # selects the next agent
@@ -1,6 +1,6 @@
 import re
 from enum import IntEnum
-from typing import Optional, TypeAlias
+from typing import Optional, Tuple, TypeAlias
 
 from .utils import Direction, Position
 
@@ -18,7 +18,13 @@ class MoveType(IntEnum):
     WITHDRAWAL = 2
 
 
+# MOVE_TYPES[move_type_int] holds the MoveType encoded by the move type component of an action
+MOVE_TYPES: Tuple[MoveType, ...] = tuple(MoveType)
+
+
 class FanoronaMove:
+    __slots__ = ("position", "direction", "move_type", "end_turn")
+
     def __init__(
         self,
         position: Position,
@@ -101,10 +107,8 @@ class FanoronaMove:
             return END_TURN_ACTION
         else:
             pos_int = self.position.to_pos()
-            dir_int = (
-                self.direction.value - 1 - (1 if self.direction.value >= 5 else 0)
-            )  # to account for Direction.X
-            move_type_int: int = self.move_type.value
+            dir_int = self.direction.to_raw_int()
+            move_type_int: int = self.move_type
             return pos_int * 8 * 3 + dir_int * 3 + move_type_int
 
     @staticmethod
@@ -129,7 +133,7 @@ class FanoronaMove:
             end_turn = False
             position = Position(pos_int)
             direction = Direction.from_raw_int(dir_int)
-            move_type = MoveType(move_type_int)
+            move_type = MOVE_TYPES[move_type_int]
         else:
             end_turn = True
             position = Position("I5")
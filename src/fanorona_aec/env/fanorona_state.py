@@ -1,19 +1,108 @@
-from typing import List, Literal, NamedTuple, Tuple, TypeAlias, Union
+from typing import Dict, List, Literal, NamedTuple, Tuple, TypeAlias
 
 import numpy as np
 
-from .fanorona_move import END_TURN, ActionType, FanoronaMove, MoveType
+from .fanorona_move import END_TURN_ACTION, ActionType, FanoronaMove, MoveType
 from .utils import (
     BOARD_COLS,
+    BOARD_MASK,
     BOARD_ROWS,
+    BOARD_SQUARES,
+    DISPLACE,
+    MOVE_DIRS,
     MOVE_LIMIT,
+    MOVE_SOURCES,
+    RAYS,
+    VALID_DIR_MASK,
     Direction,
     Piece,
     Position,
+    bits_to_board,
+    neighbours_in,
 )
 
 AgentId: TypeAlias = str
 
+START_STATE_STR = "WWWWWWWWW/WWWWWWWWW/BWBW1BWBW/BBBBBBBBB/BBBBBBBBB W - - - 0"
+
+PositionKey: TypeAlias = Tuple[int, int, int, int, int, int]
+
+# legal actions of recently generated positions, shared between all states
+LEGAL_MOVES_CACHE_SIZE = 2**16
+_legal_moves_cache: Dict[PositionKey, List[ActionType]] = {}
+
+# observation with only the constant channel 6 (all 1s) set, copied by get_observation()
+_BLANK_OBSERVATION = np.zeros(shape=(5, 9, 8), dtype=np.int8)
+_BLANK_OBSERVATION[:, :, 5] = 1
+
+# enum members used on hot paths, bound to module globals because reading an attribute of an Enum
+# class is comparatively slow
+_PAIKA = MoveType.PAIKA
+_APPROACH = MoveType.APPROACH
+_WITHDRAWAL = MoveType.WITHDRAWAL
+_NO_DIRECTION = Direction.X
+
+# (direction, opposite direction, direction component of the action) for every move direction
+_MOVE_DIR_ACTIONS: Tuple[Tuple[Direction, Direction, int], ...] = tuple(
+    (direction, direction.opposite(), direction.to_raw_int() * 3)
+    for direction in MOVE_DIRS
+)
+
+
+def _append_actions(
+    actions: List[ActionType], sources: int, action_offset: int
+) -> None:
+    "Append the action moving from each position set in sources, for a direction and move type"
+    while sources:
+        lowest = sources & -sources
+        actions.append((lowest.bit_length() - 1) * 8 * 3 + action_offset)
+        sources ^= lowest
+
+
+def _svg_coords(coord: Tuple[int, int]) -> Tuple[int, int]:
+    "Convert board coordinates to the coordinates of the corresponding point in the SVG output"
+    row, col = coord
+    return 100 + col * 100, 100 + (4 - row) * 100
+
+
+def _build_svg_board_lines() -> List[str]:
+    "Build the SVG lines drawing the board, which are the same for every state"
+    line = '<line x1="{0[0]!s}" y1="{0[1]!s}" x2="{1[0]!s}" y2="{1[1]!s}" stroke="black" stroke-width="1.5" />'
+    board_lines = []
+    for row in range(BOARD_ROWS):
+        _from_h, _to_h = _svg_coords((row, 0)), _svg_coords((row, 8))
+        board_lines.append(line.format(_from_h, _to_h))
+    for col in range(BOARD_COLS):
+        _from_v, _to_v = _svg_coords((0, col)), _svg_coords((4, col))
+        board_lines.append(line.format(_from_v, _to_v))
+    # diagonal forward lines
+    _from_df = [(2, 0), (0, 0), (0, 2), (0, 4), (0, 6)]
+    _to_df = [(4, 2), (4, 4), (4, 6), (4, 8), (2, 8)]
+    board_lines.extend(
+        [line.format(_svg_coords(f), _svg_coords(t)) for f, t in zip(_from_df, _to_df)]
+    )
+    # diagonal backward lines
+    _from_db = [(2, 0), (4, 0), (4, 2), (4, 4), (4, 6)]
+    _to_db = [(0, 2), (0, 4), (0, 6), (0, 8), (2, 8)]
+    board_lines.extend(
+        [line.format(_svg_coords(f), _svg_coords(t)) for f, t in zip(_from_db, _to_db)]
+    )
+    return board_lines
+
+
+_SVG_BOARD_LINES = _build_svg_board_lines()
+
+_SVG_PIECE = '<circle cx="{0[0]!s}" cy="{0[1]!s}" r="30" stroke="black" stroke-width="1.5" fill="{1}" />'
+
+# _SVG_PIECES[piece][pos] holds the SVG circle drawing a piece of the given colour at pos
+_SVG_PIECES: Tuple[Tuple[str, ...], ...] = tuple(
+    tuple(
+        _SVG_PIECE.format(_svg_coords(Position(pos).to_coords()), fill)
+        for pos in range(BOARD_SQUARES)
+    )
+    for fill in ("white", "black")  # indexed by Piece
+)
+
 
 class LastCapture(NamedTuple):
     position: Position
@@ -27,6 +116,16 @@ class LastCapture(NamedTuple):
 
 
 class FanoronaState:
+    __slots__ = (
+        "bitboards",
+        "turn_to_play",
+        "last_capture_pos",
+        "last_capture_dir",
+        "visited",
+        "half_moves",
+        "_legal_moves",
+    )
+
     def __init__(self) -> None:
         """
         Initializes the Fanorona state.
@@ -38,26 +137,48 @@ class FanoronaState:
             None
         """
 
-        self.board: np.ndarray[
-            Tuple[Literal[5], Literal[9]], np.dtype[np.int8]
-        ] | None = None
+        # bitmasks of the positions (flat indices) occupied by white and black pieces, indexed by
+        # Piece
+        self.bitboards: List[int] | None = None
         self.turn_to_play: Piece = Piece.EMPTY
-        self.last_capture: LastCapture | None = None
-        self.visited: np.ndarray[
-            Tuple[Literal[5], Literal[9]], np.dtype[np.bool_]
-        ] | None = None
+        # position (flat index) and direction of the last capture in the current capturing
+        # sequence. A position of -1 denotes that no capturing sequence is in progress.
+        self.last_capture_pos: int = -1
+        self.last_capture_dir: int = Direction.X
+        # bitmask of the positions (flat indices) visited in the current capturing sequence
+        self.visited: int = 0
         self.half_moves: int = 0
+        # legal actions from this state, computed lazily and cleared whenever the state changes
+        self._legal_moves: List[ActionType] | None = None
+
+    @property
+    def last_capture(self) -> LastCapture | None:
+        "The last capture made in the current capturing sequence, if any"
+        if self.last_capture_pos < 0:
+            return None
+        return LastCapture(
+            position=Position(self.last_capture_pos),
+            direction=Direction(self.last_capture_dir),
+        )
+
+    @property
+    def board(
+        self,
+    ) -> np.ndarray[Tuple[Literal[5], Literal[9]], np.dtype[np.int8]] | None:
+        "A 5x9 array of the piece on every square, built from the bitboards on each access"
+        if self.bitboards is None:
+            return None
+        white, black = self.bitboards
+        board: np.ndarray[Tuple[Literal[5], Literal[9]], np.dtype[np.int8]] = (
+            Piece.EMPTY - 2 * bits_to_board(white) - bits_to_board(black)
+        )
+        return board
 
     @property
     def visited_pos(self) -> List[Position]:
-        if self.visited is not None:
-            visited_pos_list = [
-                Position(int(visited_pos))
-                for visited_pos in np.flatnonzero(self.visited)
-            ]
-        else:
-            visited_pos_list = []
-        return visited_pos_list
+        return [
+            Position(pos) for pos in range(BOARD_SQUARES) if (self.visited >> pos) & 1
+        ]
 
     def __repr__(self) -> str:
         """
@@ -76,34 +197,36 @@ class FanoronaState:
         Returns:
             str: A string representation of the Fanorona game state.
         """
-        if self.board is None:
+        if self.bitboards is None:
             return ""
-
-        def row_str(row: np.ndarray[Literal[9], np.dtype[np.int8]]) -> str:
-            "String for each row"
-            row_ele: List[Union[int, Piece]] = []
-            for col in row:
-                if (
-                    len(row_ele) > 0
-                    and not isinstance(row_ele[-1], Piece)
-                    and col == Piece.EMPTY
-                ):
-                    row_ele[-1] += 1
+        white, black = self.bitboards
+
+        def row_str(row: int) -> str:
+            "String for each row, with runs of empty positions written as their length"
+            row_ele: List[str] = []
+            empty_run = 0
+            for pos in range(row * BOARD_COLS, (row + 1) * BOARD_COLS):
+                if (white >> pos) & 1:
+                    piece_str = "W"
+                elif (black >> pos) & 1:
+                    piece_str = "B"
                 else:
-                    if col == Piece.EMPTY:
-                        row_ele.append(1)
-                    else:
-                        row_ele.append(Piece(col))
-            row_str = "".join([str(ele) for ele in row_ele])
-            return row_str
-
-        board_pieces_str = "/".join([row_str(row) for row in self.board])
+                    empty_run += 1
+                    continue
+                if empty_run:
+                    row_ele.append(str(empty_run))
+                    empty_run = 0
+                row_ele.append(piece_str)
+            if empty_run:
+                row_ele.append(str(empty_run))
+            return "".join(row_ele)
+
+        board_pieces_str = "/".join([row_str(row) for row in range(BOARD_ROWS)])
 
         turn_to_play_str = str(Piece(self.turn_to_play))
 
         last_capture_str = str(self.last_capture) if self.last_capture else "- -"
 
-        assert self.visited is not None
         visited_pos_list = [visited_pos.to_human() for visited_pos in self.visited_pos]
         if len(visited_pos_list) == 0:
             visited_pos_str = "-"
@@ -123,9 +246,10 @@ class FanoronaState:
             Exception: If the board is None.
         """
         ELE_MAP = {Piece.WHITE: "○", Piece.BLACK: "●", Piece.EMPTY: "."}
-        if self.board is None:
+        board = self.board
+        if board is None:
             raise Exception('render(mode="human") called without calling reset()')
-        rich_board = np.vectorize(ELE_MAP.get)(self.board)
+        rich_board = np.vectorize(ELE_MAP.get)(board)
         template = f"""  A B C D E F G H I
 {5} {'─'.join(rich_board[4])}
   │╲│╱│╲│╱│╲│╱│╲│╱│
@@ -150,6 +274,26 @@ Half-moves: {self.half_moves}
             return NotImplemented
         return str(self) == str(other)
 
+    def copy(self) -> "FanoronaState":
+        """
+        Returns an independent copy of the state.
+
+        Only the list of bitboards is copied; the remaining fields are immutable and are shared with
+        the new state. This is much cheaper than `copy.deepcopy()`.
+
+        Returns:
+            FanoronaState: A copy of the state.
+        """
+        state = FanoronaState.__new__(FanoronaState)
+        state.bitboards = list(self.bitboards) if self.bitboards is not None else None
+        state.turn_to_play = self.turn_to_play
+        state.last_capture_pos = self.last_capture_pos
+        state.last_capture_dir = self.last_capture_dir
+        state.visited = self.visited
+        state.half_moves = self.half_moves
+        state._legal_moves = self._legal_moves
+        return state
+
     def to_svg(self, svg_w: int = 1000, svg_h: int = 600) -> str:
         """
         Converts the current state of the Fanorona game board to an SVG format.
@@ -162,52 +306,23 @@ Half-moves: {self.half_moves}
             str: The SVG representation of the game board.
 
         Raises:
-            Exception: If the board or visited state is None.
+            Exception: If the board is None.
 
         TODO:
             - Adjust output SVG size dynamically.
             - Represent other aspects of state on the output SVG (turn to play, last capture, visited, etc.).
         """
-
-        def convert(coord: Tuple[int, int]) -> Tuple[int, int]:
-            row, col = coord
-            return 100 + col * 100, 100 + (4 - row) * 100
-
-        if self.board is None or self.visited is None:
+        if self.bitboards is None:
             raise Exception('render(mode="svg") called without calling reset()')
 
-        black_piece = '<circle cx="{0[0]!s}" cy="{0[1]!s}" r="30" stroke="black" stroke-width="1.5" fill="black" />'
-        white_piece = '<circle cx="{0[0]!s}" cy="{0[1]!s}" r="30" stroke="black" stroke-width="1.5" fill="white" />'
-        line = '<line x1="{0[0]!s}" y1="{0[1]!s}" x2="{1[0]!s}" y2="{1[1]!s}" stroke="black" stroke-width="1.5" />'
-        board_lines = []
-        for row in range(BOARD_ROWS):
-            _from_h, _to_h = convert((row, 0)), convert((row, 8))
-            horizontal = line.format(_from_h, _to_h)
-            board_lines.append(horizontal)
-        for col in range(BOARD_COLS):
-            _from_v, _to_v = convert((0, col)), convert((4, col))
-            vertical = line.format(_from_v, _to_v)
-            board_lines.append(vertical)
-        for _ in range(0, BOARD_COLS, 2):  # diagonal forward lines
-            _from_df = [(2, 0), (0, 0), (0, 2), (0, 4), (0, 6)]
-            _to_df = [(4, 2), (4, 4), (4, 6), (4, 8), (2, 8)]
-            board_lines.extend(
-                [line.format(convert(f), convert(t)) for f, t in zip(_from_df, _to_df)]
-            )
-        for _ in range(0, BOARD_COLS, 2):  # diagonal backward lines
-            _from_db = [(2, 0), (4, 0), (4, 2), (4, 4), (4, 6)]
-            _to_db = [(0, 2), (0, 4), (0, 6), (0, 8), (2, 8)]
-            board_lines.extend(
-                [line.format(convert(f), convert(t)) for f, t in zip(_from_db, _to_db)]
-            )
+        white, black = self.bitboards
         board_pieces = []
-        for pos in Position.pos_range():
-            row, col = pos.to_coords()
-            if self.board[row][col] == Piece.WHITE:
-                board_pieces.append(white_piece.format(convert((row, col))))
-            elif self.board[row][col] == Piece.BLACK:
-                board_pieces.append(black_piece.format(convert((row, col))))
-        svg_lines = "\n\t".join(board_lines + board_pieces)
+        for pos in range(BOARD_SQUARES):
+            if (white >> pos) & 1:
+                board_pieces.append(_SVG_PIECES[Piece.WHITE][pos])
+            elif (black >> pos) & 1:
+                board_pieces.append(_SVG_PIECES[Piece.BLACK][pos])
+        svg_lines = "\n\t".join(_SVG_BOARD_LINES + board_pieces)
         svg = f"""
 <svg height="{svg_h}" width="{svg_w}">
 {svg_lines}
@@ -217,17 +332,26 @@ Half-moves: {self.half_moves}
 
     def get_piece(self, position: Position) -> Piece:
         """Return type of piece at given position (specified in integer coordinates)."""
-        if self.board is not None:
-            return Piece(self.board[position.row][position.col])
+        if self.bitboards is not None:
+            white, black = self.bitboards
+            pos = position.to_pos()
+            if (white >> pos) & 1:
+                return Piece.WHITE
+            elif (black >> pos) & 1:
+                return Piece.BLACK
+            else:
+                return Piece.EMPTY
         else:
             raise Exception("Called get_piece() without calling reset()")
 
     def piece_exists(self, piece: Piece) -> bool:
         """Checks whether an instance of a piece exists on the game board."""
-        for pos in Position.pos_range():
-            if self.get_piece(pos) == piece:
-                return True
-        return False
+        if self.bitboards is None:
+            raise Exception("Called piece_exists() without calling reset()")
+        if piece == Piece.EMPTY:
+            white, black = self.bitboards
+            return (white | black) != BOARD_MASK
+        return self.bitboards[piece] != 0
 
     def push(self, move: FanoronaMove) -> None:
         """
@@ -244,63 +368,61 @@ Half-moves: {self.half_moves}
             Exception: If `reset()` method is not called before calling `push()`.
 
         """
-        if self.board is None or self.visited is None:
+        if self.bitboards is None:
             raise Exception("Called push() without calling reset()")
-
-        # Direction.X is not part of the action space and is an internal implementation detail
-        if move.end_turn:
-            move.direction = Direction.X
-        to = move.position.displace(move.direction)
-        from_row, from_col = move.position.to_coords()
-        to_row, to_col = to.to_coords()
+        self._legal_moves = None
 
         # Assume move is valid. Validity check implemented using action mask and TerminateIllegal
         # wrapper
 
-        from_piece = self.get_piece(move.position)
-        self.board[from_row][from_col] = Piece.EMPTY
-        self.board[to_row][to_col] = from_piece
-
-        def end_turn() -> None:
-            self.turn_to_play = self.turn_to_play.other()
-            self.last_capture = None
-            assert self.visited is not None
-            self.visited.fill(0)  # reset visited ndarray
+        # the move is only read, so shared move objects such as END_TURN can be pushed safely
+        bitboards = self.bitboards
+        turn = self.turn_to_play
+        move_type = move.move_type
+        direction = move.direction
+        from_pos = move.position.to_pos()
+        if not move.end_turn:
+            to_pos = DISPLACE[from_pos][direction]
+            bitboards[turn] ^= (1 << from_pos) | (1 << to_pos)
+
+        if move.end_turn or move_type == _PAIKA:
+            # positions are only marked as visited during a capturing sequence, so there is
+            # nothing to reset after a paika
+            if self.last_capture_pos >= 0:
+                self.last_capture_pos = -1
+                self.last_capture_dir = _NO_DIRECTION
+                self.visited = 0
+            self.turn_to_play = turn.other()
             self.half_moves += 1
-
-        if move.end_turn or move.move_type == MoveType.PAIKA:
-            end_turn()
         else:
-            match move.move_type:
-                case MoveType.APPROACH:
-                    capture_pos = to.displace(move.direction)
-                    capture_dir = move.direction
-                case MoveType.WITHDRAWAL:
-                    capture_pos = move.position.displace(move.direction.opposite())
-                    capture_dir = move.direction.opposite()
-                case _:
-                    raise ValueError(
-                        f"Unexpected move type encountered: \
-                                     {move.move_type}"
-                    )
-
-            capture_row, capture_col = capture_pos.to_coords()
-            while (
-                capture_pos.is_valid()
-                and self.board[capture_row][capture_col] == self.turn_to_play.other()
-            ):
-                self.board[capture_row][capture_col] = Piece.EMPTY
-                capture_pos = capture_pos.displace(capture_dir)
-                capture_row, capture_col = capture_pos.to_coords()
-
-            self.last_capture = LastCapture(position=to, direction=move.direction)
-            self.visited[from_row][from_col] = 1
-            self.visited[to_row][to_col] = 1
+            if move_type == _APPROACH:
+                ray = RAYS[to_pos][direction]
+            elif move_type == _WITHDRAWAL:
+                ray = RAYS[from_pos][direction.opposite()]
+            else:
+                raise ValueError(
+                    f"Unexpected move type encountered: \
+                                 {move_type}"
+                )
+
+            # capture the unbroken line of opponent pieces at the start of the ray
+            other = turn.other()
+            other_bits = bitboards[other]
+            captured = 0
+            for pos in ray:
+                if not (other_bits >> pos) & 1:
+                    break
+                captured |= 1 << pos
+            bitboards[other] = other_bits ^ captured
+
+            self.last_capture_pos = to_pos
+            self.last_capture_dir = direction
+            self.visited |= (1 << from_pos) | (1 << to_pos)
 
             # if in capturing sequence, and no valid moves available (other than
             # end turn), then force turn to end
             # if len(self.legal_moves) == 1:
-            #     end_turn()
+            #     self.push(END_TURN)
 
     @property
     def done(self) -> bool:
@@ -317,12 +439,15 @@ Half-moves: {self.half_moves}
         """
         if self.half_moves >= MOVE_LIMIT:
             return True
+        elif self.bitboards is None:
+            raise Exception("Called done without calling reset()")
         else:
-            own_piece_exists = self.piece_exists(self.turn_to_play)
-            other_piece_exists = self.piece_exists(self.turn_to_play.other())
+            # both sides must still have pieces, which is checked directly on the bitboards since
+            # this is evaluated after every move
+            white, black = self.bitboards
             # Conjecture: cannot have a situation in Fanorona where a piece exists but there are no
             # valid moves
-            return not (own_piece_exists and other_piece_exists)
+            return not (white and black)
 
     @property
     def winner(self) -> Piece | None:
@@ -350,10 +475,16 @@ Half-moves: {self.half_moves}
         """
         Reset the state of the Fanorona game to the start state.
 
-        This method sets the state of the game board to the initial configuration.
+        This method sets the state of the game board to the initial configuration. The start
+        position is parsed once at import, so no string is parsed here.
         """
-        START_STATE_STR = "WWWWWWWWW/WWWWWWWWW/BWBW1BWBW/BBBBBBBBB/BBBBBBBBB W - - - 0"
-        self.set_from_board_str(START_STATE_STR)
+        self.bitboards = list(_START_BITBOARDS)
+        self.turn_to_play = Piece.WHITE
+        self.last_capture_pos = -1
+        self.last_capture_dir = Direction.X
+        self.visited = 0
+        self.half_moves = 0
+        self._legal_moves = None
 
     def set_from_board_str(self, board_string: str) -> "FanoronaState":
         """
@@ -365,44 +496,37 @@ Half-moves: {self.half_moves}
         Returns:
             FanoronaState: The updated state object.
         """
+        self._legal_moves = None
 
         def process_board_state_str(
             self: FanoronaState, board_state_str: str
-        ) -> np.ndarray[Tuple[Literal[5], Literal[9]], np.dtype[np.int8]]:
+        ) -> List[int]:
             row_strings = board_state_str.split("/")
             board_state_chars = [list(row) for row in row_strings]
-            self.board = np.zeros(shape=(BOARD_ROWS, BOARD_COLS), dtype=np.int8)
+            self.bitboards = [0, 0]
             for row, row_content in enumerate(board_state_chars):
                 col_board = 0
                 for col_content in row_content:
                     match col_content:
                         case "W":
-                            self.board[row][col_board] = Piece.WHITE
+                            self.bitboards[Piece.WHITE] |= 1 << (
+                                row * BOARD_COLS + col_board
+                            )
                             col_board += 1
                         case "B":
-                            self.board[row][col_board] = Piece.BLACK
+                            self.bitboards[Piece.BLACK] |= 1 << (
+                                row * BOARD_COLS + col_board
+                            )
                             col_board += 1
                         case _:
-                            self.board[row][
-                                col_board : col_board + int(col_content)
-                            ] = Piece.EMPTY
                             col_board += int(col_content)
-            return self.board
+            return self.bitboards
 
-        def process_visited_pos_str(
-            self: FanoronaState, visited_pos_str: str
-        ) -> np.ndarray[Tuple[Literal[5], Literal[9]], np.dtype[np.bool_]]:
-            self.visited = np.zeros(shape=(BOARD_ROWS, BOARD_COLS), dtype=np.bool_)
+        def process_visited_pos_str(self: FanoronaState, visited_pos_str: str) -> int:
+            self.visited = 0
             if visited_pos_str != "-":
-                visited_pos_list = visited_pos_str.split(",")
-                human_pos_list = list(
-                    map(
-                        lambda human_pos: Position(human_pos).to_coords(),
-                        visited_pos_list,
-                    )
-                )
-                rows, cols = zip(*human_pos_list)
-                self.visited[rows, cols] = True
+                for human_pos in visited_pos_str.split(","):
+                    self.visited |= 1 << Position(human_pos).to_pos()
             return self.visited
 
         (
@@ -419,12 +543,11 @@ Half-moves: {self.half_moves}
         self.turn_to_play = Piece.WHITE if turn_to_play_str == "W" else Piece.BLACK
 
         if last_capture_pos != "-" and last_capture_dir != "-":
-            self.last_capture = LastCapture(
-                position=Position(last_capture_pos),
-                direction=Direction.from_str(last_capture_dir),
-            )
+            self.last_capture_pos = Position(last_capture_pos).to_pos()
+            self.last_capture_dir = Direction.from_str(last_capture_dir)
         else:
-            self.last_capture = None
+            self.last_capture_pos = -1
+            self.last_capture_dir = Direction.X
 
         process_visited_pos_str(self, visited_pos_str)
 
@@ -438,10 +561,11 @@ Half-moves: {self.half_moves}
         """Return NN-style observation based on the current board state and requesting agent. Board
         state is from the perspective of the agent, with their color at the bottom.
         """
-        if self.board is None or self.visited is None:
+        if self.bitboards is None:
             raise Exception("Called get_observation() without calling reset()")
 
-        obs = np.zeros(shape=(5, 9, 8), dtype=np.int8)
+        # channel 6 is set as part of the initial array
+        obs = _BLANK_OBSERVATION.copy()
         # TODO: how to handle different observations from different sides? Specifically, how would actions change?
 
         # channel 1
@@ -455,34 +579,26 @@ Half-moves: {self.half_moves}
         obs[half_moves_pos.row, half_moves_pos.col, 1] = 1
 
         # channel 3
-        obs[:, :, 2] = self.visited.copy()
+        if self.visited:
+            obs[:, :, 2] = bits_to_board(self.visited)
 
-        if self.last_capture is not None:
+        if self.last_capture_pos >= 0:
             # channel 4
-            obs[self.last_capture[0].row, self.last_capture[0].col, 3] = 1
+            obs.reshape(-1, 8)[self.last_capture_pos, 3] = 1
 
             # channel 5
             last_dir_int = (
-                int(self.last_capture[1])
-                - 1
-                - (1 if int(self.last_capture[1].value) >= 4 else 0)
+                self.last_capture_dir - 1 - (1 if self.last_capture_dir >= 4 else 0)
             )
             obs[:, last_dir_int, 4] = 1
 
-        # channel 6
-        obs[:, :, 5].fill(1)
+        white, black = self.bitboards
 
         # channel 7
-        white_pieces_mask = self.board != int(Piece.WHITE)
-        obs[:, :, 6] = self.board.copy()
-        obs[white_pieces_mask, 6] = 1
-        obs[~white_pieces_mask, 6] = 0
+        obs[:, :, 6] = 1 - bits_to_board(white)
 
         # channel 8
-        black_pieces_mask = self.board != int(Piece.BLACK)
-        obs[:, :, 7] = self.board.copy()
-        obs[black_pieces_mask, 7] = 1
-        obs[~black_pieces_mask, 7] = 0
+        obs[:, :, 7] = 1 - bits_to_board(black)
 
         return obs
 
@@ -494,139 +610,158 @@ Half-moves: {self.half_moves}
         2. the square being moved from contains a piece of that colour
         3. the move is not an end turn
         """
-        if self.board is None or self.visited is None:
+        if self.bitboards is None:
             raise Exception(f"Called is_valid({str(move)}) without calling reset()")
 
-        to = move.position.displace(move.direction)
-        if move.move_type == MoveType.APPROACH:
-            capture = to.displace(move.direction)
-        elif move.move_type == MoveType.WITHDRAWAL:
-            capture = move.position.displace(move.direction.opposite())
-        else:
-            capture = Position(
-                "A1"
-            )  # dummy position to ensure capture.is_valid() is True
+        # bounds checking on positions
+        if not move.position.is_valid():
+            return False
+        from_pos = move.position.to_pos()
+        to_pos = DISPLACE[from_pos][move.direction]
+        if to_pos < 0:
+            return False
 
-        def check_bounds() -> bool:
-            """Bounds checking on positions"""
-            return all(map(lambda pos: pos.is_valid(), (move.position, to, capture)))
+        # move direction must be permitted from given board position
+        if not (VALID_DIR_MASK[from_pos] >> move.direction) & 1:
+            return False
 
-        def check_valid_dir() -> bool:
-            """Checking that move direction is permitted from given board position"""
-            return move.direction in move.position.get_valid_dirs()
+        # piece must be moved to an empty location
+        white, black = self.bitboards
+        if ((white | black) >> to_pos) & 1:
+            return False
 
-        def check_move_to_empty() -> bool:
-            """Checking that piece is being moved to empty location"""
-            if self.get_piece(to) != Piece.EMPTY:
-                return False
+        if move.move_type == _PAIKA:
             return True
 
-        def check_opposite_color_capture() -> bool:
-            """Checking that piece being captured is of opposite color"""
-            if (
-                capture.is_valid()
-                and self.get_piece(capture) != self.turn_to_play.other()
-            ):  # capturing line must start with opponent color stone
+        if move.move_type == _APPROACH:
+            capture_pos = DISPLACE[to_pos][move.direction]
+        else:
+            capture_pos = DISPLACE[from_pos][move.direction.opposite()]
+
+        # capturing line must start with opponent color stone
+        if (
+            capture_pos < 0
+            or not (self.bitboards[self.turn_to_play.other()] >> capture_pos) & 1
+        ):
+            return False
+
+        if self.last_capture_pos >= 0:  # in capturing sequence
+            # capturing piece must be the one being moved, and not some other piece
+            if self.last_capture_pos != from_pos:
                 return False
-            return True
 
-        def check_move_only_capturing_piece() -> bool:
-            """If in a capturing sequence, check that capturing piece is the one being moved, and
-            not some other piece
-            """
-            assert self.last_capture is not None
-            if self.last_capture[0] != move.position:
+            # capturing piece must not visit a previously visited pos in capturing path
+            if (self.visited >> to_pos) & 1:
                 return False
-            return True
 
-        def check_no_overlap() -> bool:
-            """Check that capturing piece is not visiting previously visited pos in capturing path"""
-            assert self.visited is not None
-            _to_row, _to_col = to.to_coords()
-            if self.visited[_to_row][_to_col] == 1:
+            # capturing piece must not move twice in the same direction
+            if move.direction == self.last_capture_dir:
                 return False
-            return True
 
-        def check_no_same_dir() -> bool:
-            """Check that capturing piece is not moving twice in the same direction"""
-            assert self.last_capture is not None
-            return move.direction != self.last_capture[1]
-
-        if move.move_type == MoveType.PAIKA:
-            valid = all(
-                test()
-                for test in [
-                    check_bounds,
-                    check_valid_dir,
-                    check_move_to_empty,
-                ]
-            )
-        elif self.last_capture is None:  # beginning of capturing sequence
-            valid = all(
-                test()
-                for test in [
-                    check_bounds,
-                    check_valid_dir,
-                    check_move_to_empty,
-                    check_opposite_color_capture,
-                ]
-            )
-        else:  # in capturing sequence
-            valid = all(
-                test()
-                for test in [
-                    check_bounds,
-                    check_valid_dir,
-                    check_move_to_empty,
-                    check_opposite_color_capture,
-                    check_move_only_capturing_piece,
-                    check_no_overlap,
-                    check_no_same_dir,
-                ]
-            )
-        return valid
+        return True
 
     @property
     def legal_moves(self) -> List[ActionType]:
-        """Return a list of legal actions allowed from the current state."""
-        legal_captures: List[FanoronaMove] = []
-        legal_paikas: List[FanoronaMove] = []
-
-        # check for captures involving last moved piece only if in capturing sequence
-        if self.last_capture:
-            pos = self.last_capture[0]
-            for direction in Direction:
-                for capture_type in [MoveType.APPROACH, MoveType.WITHDRAWAL]:
-                    capture = FanoronaMove(pos, direction, capture_type, False)
-                    if self.is_valid(capture):
-                        legal_captures.append(capture)
-
-            # add end turn
-            legal_captures.append(END_TURN)
-
-        # check for captures
-        for pos in Position.pos_range():
-            if self.get_piece(pos) == self.turn_to_play:
-                for direction in Direction:
-                    for capture_type in [
-                        MoveType.APPROACH,
-                        MoveType.WITHDRAWAL,
-                    ]:
-                        capture = FanoronaMove(pos, direction, capture_type, False)
-                        if self.is_valid(capture):
-                            legal_captures.append(capture)
-
-        # only check for paikas if no captures exist
-        if not legal_captures:
-            for pos in Position.pos_range():
-                if self.get_piece(pos) == self.turn_to_play:
-                    for direction in Direction:
-                        paika = FanoronaMove(pos, direction, MoveType.PAIKA, False)
-                        if self.is_valid(paika):
-                            legal_paikas.append(paika)
+        """
+        Return a list of legal actions allowed from the current state.
+
+        Move generation is the most expensive operation on the state, so its result is cached
+        until the next call to `push()` or `set_from_board_str()`. Results are also shared through
+        a bounded module-level cache keyed by `position_key()`, so that positions reached again
+        (in another game, or by another copy of the state) are not regenerated. A fresh list is
+        returned each time so that callers are free to modify it.
+        """
+        if self._legal_moves is None:
+            key = self.position_key()
+            legal_moves = _legal_moves_cache.get(key)
+            if legal_moves is None:
+                if len(_legal_moves_cache) >= LEGAL_MOVES_CACHE_SIZE:
+                    _legal_moves_cache.clear()
+                legal_moves = self._generate_legal_moves()
+                _legal_moves_cache[key] = legal_moves
+            self._legal_moves = legal_moves
+        return list(self._legal_moves)
+
+    def position_key(self) -> PositionKey:
+        """
+        Return a hashable key identifying the position, i.e. everything that determines the legal
+        moves. Unlike `__eq__()`, the half-move counter is not part of the key.
+
+        Raises:
+            Exception: If `reset()` method is not called before calling `position_key()`.
+        """
+        if self.bitboards is None:
+            raise Exception("Called position_key() without calling reset()")
+        white, black = self.bitboards
+        return (
+            white,
+            black,
+            self.turn_to_play,
+            self.last_capture_pos,
+            self.last_capture_dir,
+            self.visited,
+        )
+
+    def _generate_legal_moves(self) -> List[ActionType]:
+        "Generate the list of legal actions allowed from the current state"
+        if self.bitboards is None:
+            raise Exception("Called legal_moves without calling reset()")
+        white, black = self.bitboards
+        own = self.bitboards[self.turn_to_play]
+        other = self.bitboards[self.turn_to_play.other()]
+        empty = BOARD_MASK & ~(white | black)
+
+        in_capturing_sequence = self.last_capture_pos >= 0
+        if in_capturing_sequence:
+            # only the capturing piece can move, and only to positions it has not visited yet
+            own = 1 << self.last_capture_pos
+            empty &= ~self.visited
+
+        # all moves along a direction are found at once as bitmasks of the positions moved from
+        legal_captures: List[ActionType] = []
+        paika_sources: List[Tuple[int, int]] = []
+        for direction, opposite, action_offset in _MOVE_DIR_ACTIONS:
+            # capturing piece must not move twice in the same direction
+            if in_capturing_sequence and direction == self.last_capture_dir:
+                continue
+
+            # pieces which can be moved along direction to an empty position
+            movers = own & MOVE_SOURCES[direction] & neighbours_in(empty, direction)
+            if not movers:
+                continue
+
+            # approach: an opponent piece lies beyond the position moved to
+            approaches = movers & neighbours_in(
+                neighbours_in(other, direction), direction
+            )
+            _append_actions(legal_captures, approaches, action_offset + _APPROACH)
 
+            # withdrawal: an opponent piece lies behind the position moved from
+            withdrawals = movers & neighbours_in(other, opposite)
+            _append_actions(legal_captures, withdrawals, action_offset + _WITHDRAWAL)
+
+            paika_sources.append((movers, action_offset + _PAIKA))
+        legal_captures.sort()
+
+        if in_capturing_sequence:
+            # the capturing piece's moves are listed both before and after the end turn action
+            return legal_captures + [END_TURN_ACTION] + legal_captures
         if legal_captures:  # capture has to be made if available
-            legal_moves = legal_captures
-        else:
-            legal_moves = legal_paikas
-        return list(map(lambda move: move.to_action(), legal_moves))
+            return legal_captures
+
+        legal_paikas: List[ActionType] = []
+        for movers, action_offset in paika_sources:
+            _append_actions(legal_paikas, movers, action_offset)
+        legal_paikas.sort()
+        return legal_paikas
+
+
+def _parse_start_bitboards() -> Tuple[int, int]:
+    "Parse the bitboards of the start position"
+    bitboards = FanoronaState().set_from_board_str(START_STATE_STR).bitboards
+    assert bitboards is not None
+    white, black = bitboards
+    return white, black
+
+
+_START_BITBOARDS = _parse_start_bitboards()
@@ -1,11 +1,17 @@
 from enum import IntEnum
-from typing import Iterator, List, Tuple, Union
+from typing import Iterator, List, Literal, Tuple, Union
+
+import numpy as np
 
 BOARD_ROWS: int = 5
 BOARD_COLS: int = 9
 MOVE_LIMIT: int = 44
 
 BOARD_SQUARES = BOARD_ROWS * BOARD_COLS
+# bitmask with the bit of every flat board position set
+BOARD_MASK: int = (1 << BOARD_SQUARES) - 1
+
+_BIT_SHIFTS = np.arange(BOARD_SQUARES, dtype=np.int64)
 
 
 class Piece(IntEnum):
@@ -13,19 +19,20 @@ class Piece(IntEnum):
         return str(self.name)[0]  # just the first letter
 
     def other(self) -> "Piece":
-        match self:
-            case Piece.WHITE:
-                return Piece.BLACK
-            case Piece.BLACK:
-                return Piece.WHITE
-            case _:
-                raise ValueError(f"Cannot define `other()` for {str(self)}")
+        try:
+            return _OTHER_PIECE[self]
+        except IndexError:
+            raise ValueError(f"Cannot define `other()` for {str(self)}") from None
 
     WHITE = 0
     BLACK = 1
     EMPTY = 2
 
 
+# _OTHER_PIECE[piece] holds piece.other() for the two player colours
+_OTHER_PIECE: Tuple[Piece, Piece] = (Piece.BLACK, Piece.WHITE)
+
+
 class Direction(IntEnum):
     "Uses numpad coordinates to represent directions"
 
@@ -48,36 +55,29 @@ class Direction(IntEnum):
     @staticmethod
     def from_raw_int(raw_int: int) -> "Direction":
         "Return a Direction from the encoded direction component of an action"
-        dir_int = raw_int + 1  # Direction enums start from 1
-        if raw_int >= 4:  # to account for Direction.X
-            dir_int += 1
-        return Direction(dir_int)
+        if not 0 <= raw_int < len(MOVE_DIRS):
+            raise ValueError(f"Invalid raw direction: {raw_int}")
+        return MOVE_DIRS[raw_int]
+
+    # Enum's `value` is a descriptor and much slower to read than the IntEnum member itself, so
+    # the methods below, which are used on hot paths, work with `self` directly
+
+    def to_raw_int(self) -> int:
+        "Return the encoded direction component of an action, the inverse of `from_raw_int()`"
+        # to account for Direction.X
+        return self - 1 - (1 if self >= 5 else 0)
 
     def opposite(self) -> "Direction":
         "Return the direction of opposite orientation to the current one e.g. NE.opposite() == SW"
-        return Direction(10 - self.value)
+        return _OPPOSITE_DIR[self]
 
     def as_vector(self) -> Tuple[int, int]:
         "Return the unit vector representation of the direction (with tail assumed at (0, 0))"
-        # fmt: off
-        DISPLACEMENT_VECTORS = {
-            1: (-1, -1),
-            2: (-1,  0),
-            3: (-1,  1),
-            4: ( 0, -1),
-            5: ( 0,  0),
-            6: ( 0,  1),
-            7: ( 1, -1),
-            8: ( 1,  0),
-            9: ( 1,  1),
-        }
-        # fmt: on
-        return DISPLACEMENT_VECTORS[self.value]
+        return _DISPLACEMENT_VECTORS[self]
 
     @staticmethod
     def dir_range() -> Iterator["Direction"]:
-        for i in range(9):
-            yield Direction(i)
+        yield from _ALL_DIRS
 
     # fmt: off
     SW = 1
@@ -92,7 +92,39 @@ class Direction(IntEnum):
     # fmt: on
 
 
+_ALL_DIRS: Tuple[Direction, ...] = tuple(Direction)
+
+# _DISPLACEMENT_VECTORS[direction] holds direction.as_vector() (index 0 is unused, Direction enums
+# start from 1)
+# fmt: off
+_DISPLACEMENT_VECTORS: Tuple[Tuple[int, int], ...] = (
+    ( 0,  0),
+    (-1, -1), (-1,  0), (-1,  1),
+    ( 0, -1), ( 0,  0), ( 0,  1),
+    ( 1, -1), ( 1,  0), ( 1,  1),
+)
+# fmt: on
+
+# MOVE_DIRS holds the directions along which a piece can be moved, in canonical order
+MOVE_DIRS: Tuple[Direction, ...] = tuple(
+    direction for direction in _ALL_DIRS if direction != Direction.X
+)
+
+# _OPPOSITE_DIR[direction] holds direction.opposite() (index 0 is unused, Direction enums start
+# from 1)
+# fmt: off
+_OPPOSITE_DIR: Tuple[Direction, ...] = (
+    Direction.X,
+    Direction.NE, Direction.N, Direction.NW,
+    Direction.E,  Direction.X, Direction.W,
+    Direction.SE, Direction.S, Direction.SW,
+)
+# fmt: on
+
+
 class Position:
+    __slots__ = ("row", "col")
+
     def __init__(self, pos: Union[Tuple[int, int], str, int]):
         self.row: int = 0
         self.col: int = 0
@@ -245,3 +277,89 @@ class Position:
                                  {row}, col={col}"
                 )
         return dir_list
+
+
+# VALID_DIRS[pos] holds the directions along which a piece can move from pos, in canonical order
+VALID_DIRS: Tuple[Tuple[Direction, ...], ...] = tuple(
+    tuple(sorted(pos.get_valid_dirs())) for pos in Position.pos_range()
+)
+
+# VALID_DIR_MASK[pos] has bit d set iff a piece can move from pos along Direction(d)
+VALID_DIR_MASK: Tuple[int, ...] = tuple(
+    sum(1 << direction for direction in valid_dirs) for valid_dirs in VALID_DIRS
+)
+
+
+def _displace_pos(pos: Position, dir_int: int) -> int:
+    "Return the flat index of the position reached from pos along dir_int, or -1 if off-board"
+    if dir_int == 0:  # Direction enums start from 1
+        return -1
+    displaced = pos.displace(Direction(dir_int))
+    return displaced.to_pos() if displaced.is_valid() else -1
+
+
+# DISPLACE[pos][direction] holds the flat index of the position one step from pos along direction,
+# or -1 if that step leaves the board (index 0 is unused, Direction enums start from 1)
+DISPLACE: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(_displace_pos(pos, dir_int) for dir_int in range(10))
+    for pos in Position.pos_range()
+)
+
+
+def _build_rays() -> Tuple[Tuple[Tuple[int, ...], ...], ...]:
+    "Build the table of capture rays for every board position and direction"
+    rays = []
+    for pos in Position.pos_range():
+        pos_rays = []
+        for dir_int in range(10):  # index 0 is unused, Direction enums start from 1
+            ray = []
+            if dir_int not in (0, Direction.X):
+                direction = Direction(dir_int)
+                ray_pos = pos.displace(direction)
+                while ray_pos.is_valid():
+                    ray.append(ray_pos.to_pos())
+                    ray_pos = ray_pos.displace(direction)
+            pos_rays.append(tuple(ray))
+        rays.append(tuple(pos_rays))
+    return tuple(rays)
+
+
+# RAYS[pos][direction] holds the flat indices of the squares strictly beyond pos along direction,
+# up to the edge of the board
+RAYS = _build_rays()
+
+
+# DIR_STEP[direction] holds the change in flat index from moving one step along direction
+DIR_STEP: Tuple[int, ...] = (0,) + tuple(
+    direction.as_vector()[0] * BOARD_COLS + direction.as_vector()[1]
+    for direction in Direction
+)
+
+# HAS_NEIGHBOUR[direction] has the bit of pos set iff the step from pos along direction stays on
+# the board
+HAS_NEIGHBOUR: Tuple[int, ...] = tuple(
+    sum(1 << pos for pos in range(BOARD_SQUARES) if DISPLACE[pos][dir_int] >= 0)
+    for dir_int in range(10)
+)
+
+# MOVE_SOURCES[direction] has the bit of pos set iff a piece can move from pos along direction
+MOVE_SOURCES: Tuple[int, ...] = tuple(
+    sum(
+        1 << pos for pos in range(BOARD_SQUARES) if (VALID_DIR_MASK[pos] >> dir_int) & 1
+    )
+    for dir_int in range(10)
+)
+
+
+def neighbours_in(bits: int, direction: int) -> int:
+    "Return the bitmask of positions whose neighbour along direction is set in the bitmask bits"
+    step = DIR_STEP[direction]
+    shifted = bits >> step if step >= 0 else (bits << -step) & BOARD_MASK
+    return shifted & HAS_NEIGHBOUR[direction]
+
+
+def bits_to_board(
+    bits: int,
+) -> np.ndarray[Tuple[Literal[5], Literal[9]], np.dtype[np.int8]]:
+    "Unpack a bitmask over flat board positions into a 5x9 array of 0s and 1s"
+    return ((bits >> _BIT_SHIFTS) & 1).astype(np.int8).reshape(BOARD_ROWS, BOARD_COLS)
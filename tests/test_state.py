@@ -1,7 +1,14 @@
+import pickle
+
 import numpy as np
 import pytest
 
-from fanorona_aec.env.fanorona_move import FanoronaMove
+from fanorona_aec.env.fanorona_move import (
+    END_TURN,
+    END_TURN_ACTION,
+    FanoronaMove,
+    MoveType,
+)
 from fanorona_aec.env.fanorona_state import FanoronaState
 from fanorona_aec.env.utils import Piece, Position
 
@@ -36,6 +43,21 @@ def test_str(test_state_list):
         assert str(test_state) == expected_str
 
 
+def test_copy(start_state):
+    "Test that a copied state is equal to the original and does not share mutable data"
+    state_copy = start_state.copy()
+    assert state_copy == start_state
+    state_copy.push(FanoronaMove.from_action(state_copy.legal_moves[0]))
+    assert state_copy != start_state
+    assert str(start_state) == TEST_STATE_STRS[0]
+
+
+def test_pickle(start_state):
+    "Test that a state survives a round trip through pickle"
+    start_state.push(FanoronaMove.from_action(start_state.legal_moves[0]))
+    assert pickle.loads(pickle.dumps(start_state)) == start_state
+
+
 def test_to_svg(test_state_list):
     "Test that state is correctly output as an svg file"
     for test_state in test_state_list:
@@ -55,6 +77,17 @@ def test_get_piece(start_state, test_input, expected):
     assert start_state.get_piece(Position(test_input)) == expected
 
 
+def test_board(start_state):
+    "Verify that the board array built from the bitboards matches the start position"
+    W, B, E = Piece.WHITE, Piece.BLACK, Piece.EMPTY
+    expected = np.array(
+        [[W] * 9, [W] * 9, [B, W, B, W, E, B, W, B, W], [B] * 9, [B] * 9],
+        dtype=np.int8,
+    )
+    assert np.array_equal(start_state.board, expected)
+    assert FanoronaState().board is None
+
+
 @pytest.mark.parametrize(
     "state_str,piece",
     [
@@ -95,6 +128,63 @@ def test_push(test_state_list):
             state.push(move)
 
 
+def test_legal_moves_cache(start_state):
+    "Test that cached legal moves are not shared with callers and are refreshed after push()"
+    legal_moves = start_state.legal_moves
+    legal_moves.clear()
+    assert start_state.legal_moves
+    start_state.push(FanoronaMove.from_action(start_state.legal_moves[0]))
+    assert (
+        start_state.legal_moves
+        == FanoronaState().set_from_board_str(str(start_state)).legal_moves
+    )
+
+
+def test_legal_moves_agree_with_is_valid(test_state_list):
+    "Test that the bitboard move generator finds exactly the moves accepted by is_valid()"
+    rng = np.random.default_rng(seed=0)
+    for state in test_state_list:
+        while not state.done:
+            captures, paikas = set(), set()
+            for pos in Position.pos_range():
+                if state.get_piece(pos) != state.turn_to_play:
+                    continue
+                for direction in pos.get_valid_dirs():
+                    for move_type in MoveType:
+                        move = FanoronaMove(pos, direction, move_type, False)
+                        if state.is_valid(move):
+                            moves = paikas if move_type == MoveType.PAIKA else captures
+                            moves.add(move.to_action())
+            if state.last_capture is not None:
+                expected = captures | {END_TURN_ACTION}
+            else:
+                expected = captures or paikas
+            assert set(state.legal_moves) == expected
+            state.push(FanoronaMove.from_action(rng.choice(state.legal_moves)))
+
+
+def test_position_key(test_state_list):
+    "Test that position_key() identifies a position regardless of the half-move counter"
+    keys = [state.position_key() for state in test_state_list]
+    assert len(set(keys)) == len(TEST_STATE_STRS)
+    later_state = FanoronaState().set_from_board_str(
+        TEST_STATE_STRS[0].replace(" 0", " 10")
+    )
+    assert later_state.position_key() == keys[0]
+
+
+def test_push_end_turn():
+    "Test that pushing the shared END_TURN move ends the capturing sequence without modifying it"
+    state = FanoronaState().set_from_board_str(TEST_STATE_STRS[1])
+    state.push(FanoronaMove.from_action(state.legal_moves[0]))
+    assert state.last_capture is not None
+    end_turn_str = str(END_TURN)
+    state.push(END_TURN)
+    assert state.last_capture is None
+    assert state.turn_to_play == Piece.WHITE
+    assert str(END_TURN) == end_turn_str
+
+
 def test_done(test_state_list, expected_list=[False, False, True, True, True]):
     "Test that done property is correctly identifying end of game states."
     for test_state, expected in zip(test_state_list, expected_list):
@@ -1,6 +1,6 @@
 import pytest
 
-from fanorona_aec.env.utils import Direction, Position
+from fanorona_aec.env.utils import DISPLACE, VALID_DIRS, Direction, Piece, Position
 
 # fmt: off
 POS = (
@@ -128,6 +128,14 @@ def test_get_valid_dirs(test_input, expected):
     assert sorted(Position(test_input).get_valid_dirs()) == sorted(expected)
 
 
+@pytest.mark.parametrize("test_input", range(45))
+def test_valid_dirs_table(test_input):
+    "Verify that the precomputed VALID_DIRS table agrees with Position.get_valid_dirs()"
+    assert sorted(VALID_DIRS[test_input]) == sorted(
+        Position(test_input).get_valid_dirs()
+    )
+
+
 @pytest.mark.parametrize(
     "test_input,expected",
     [
@@ -145,3 +153,63 @@ def test_get_valid_dirs(test_input, expected):
 def test_displace(test_input, expected):
     "Test that displace() returns the right result for all possible directions from a position"
     assert Position((0, 0)).displace(Direction(test_input)) == Position(expected)
+
+
+@pytest.mark.parametrize(
+    "test_input,expected",
+    [
+        (Piece.WHITE, Piece.BLACK),
+        (Piece.BLACK, Piece.WHITE),
+        pytest.param(Piece.EMPTY, None, marks=pytest.mark.xfail(raises=ValueError)),
+    ],
+)
+def test_other(test_input, expected):
+    "Test that other() returns the piece of the opposing colour"
+    assert test_input.other() is expected
+
+
+@pytest.mark.parametrize(
+    "test_input,expected",
+    [
+        (Direction.SW, Direction.NE),
+        (Direction.S, Direction.N),
+        (Direction.SE, Direction.NW),
+        (Direction.W, Direction.E),
+        (Direction.X, Direction.X),
+        (Direction.E, Direction.W),
+        (Direction.NW, Direction.SE),
+        (Direction.N, Direction.S),
+        (Direction.NE, Direction.SW),
+    ],
+)
+def test_opposite(test_input, expected):
+    "Test that opposite() returns the direction of opposite orientation"
+    assert test_input.opposite() is expected
+
+
+@pytest.mark.parametrize(
+    "test_input,expected",
+    [
+        (Direction.SW, (-1, -1)),
+        (Direction.X, (0, 0)),
+        (Direction.E, (0, 1)),
+        (Direction.N, (1, 0)),
+    ],
+)
+def test_as_vector(test_input, expected):
+    "Test that as_vector() returns the unit displacement along the direction"
+    assert test_input.as_vector() == expected
+
+
+def test_dir_range():
+    "Test that dir_range() yields every direction exactly once"
+    assert list(Direction.dir_range()) == list(Direction)
+
+
+@pytest.mark.parametrize("test_input", range(45))
+def test_displace_table(test_input):
+    "Verify that the precomputed DISPLACE table agrees with Position.displace()"
+    for direction in Direction:
+        displaced = Position(test_input).displace(direction)
+        expected = displaced.to_pos() if displaced.is_valid() else -1
+        assert DISPLACE[test_input][direction] == expected